@@ -0,0 +1,96 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from listings.models import Listing, Booking, STATUS
+from listings.pricing import compute_totals
+from datetime import date
+from decimal import Decimal
+import csv
+
+
+REQUIRED_COLUMNS = {'listing_id', 'start_date', 'end_date'}
+STATUS_VALUES = {value for value, _ in STATUS}
+
+
+class Command(BaseCommand):
+    """
+    Custom Django management command to bulk import bookings from a CSV file.
+    """
+
+    help = "Imports bookings from a CSV file with listing_id, start_date, end_date and optional status columns"
+
+    def add_arguments(self, parser):
+        """
+        Path to the CSV file and the number of rows per INSERT
+        """
+        parser.add_argument('csv_file', type=str, help="Path to the CSV file to import")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Number of bookings per INSERT")
+
+
+    def handle(self, *args, **kwargs):
+        """
+        Reads the CSV, prices every row in one pass and saves the bookings with bulk_create.
+        Rows that cannot be parsed, reference an unknown listing, have an invalid status,
+        or have dates or totals the booking columns cannot store are skipped.
+        """
+
+        try:
+            with open(kwargs['csv_file'], newline='') as csv_file:
+                reader = csv.DictReader(csv_file)
+                missing = REQUIRED_COLUMNS - set(reader.fieldnames or [])
+                if missing:
+                    raise CommandError(f"Missing required columns: {', '.join(sorted(missing))}")
+                rows = list(reader)
+        except OSError as e:
+            raise CommandError(f"Could not read {kwargs['csv_file']}: {e}")
+
+        # parse every row up front; line numbers count the header as line 1
+        parsed = []
+        for line, row in enumerate(rows, start=2):
+            try:
+                listing_id = Listing._meta.pk.to_python(row['listing_id'])
+                start_date = date.fromisoformat(row['start_date'])
+                end_date = date.fromisoformat(row['end_date'])
+            except (ValidationError, ValueError, TypeError):
+                self.stdout.write(self.style.WARNING(f"Skipping line {line}: invalid listing_id or date"))
+                continue
+            status = row.get('status') or 'pending'
+            if status not in STATUS_VALUES:
+                self.stdout.write(self.style.WARNING(f"Skipping line {line}: invalid status {status!r}"))
+                continue
+            parsed.append((line, listing_id, start_date, end_date, status))
+
+        # fetch the nightly price of every referenced listing in a single query
+        prices = dict(
+            Listing.objects.filter(pk__in={listing_id for _, listing_id, *_ in parsed})
+            .values_list('listing_id', 'price_per_night')
+        )
+        for line, listing_id, *_ in parsed:
+            if listing_id not in prices:
+                self.stdout.write(self.style.WARNING(f"Skipping line {line}: unknown listing {listing_id}"))
+        parsed = [entry for entry in parsed if entry[1] in prices]
+
+        nights, totals, valid = compute_totals(
+            [start_date.toordinal() for _, _, start_date, _, _ in parsed],
+            [end_date.toordinal() for _, _, _, end_date, _ in parsed],
+            [int(prices[listing_id] * 100) for _, listing_id, *_ in parsed],
+        )
+
+        bookings = []
+        for (line, listing_id, start_date, end_date, status), num_nights, total_cents, ok in zip(
+            parsed, nights, totals, valid
+        ):
+            if not ok:
+                self.stdout.write(self.style.WARNING(f"Skipping line {line}: invalid dates or total price"))
+                continue
+            bookings.append(Booking(
+                listing_id=listing_id,
+                start_date=start_date,
+                end_date=end_date,
+                nights=num_nights,
+                total_price=Decimal(total_cents).scaleb(-2),
+                status=status,
+            ))
+        Booking.objects.bulk_create(bookings, batch_size=kwargs['batch_size'])
+
+        skipped = len(rows) - len(bookings)
+        self.stdout.write(self.style.SUCCESS(f"Successfully imported {len(bookings)} bookings ({skipped} skipped)"))
@@ -1,6 +1,5 @@
 from django.core.management.base import BaseCommand
 from listings.models import Listing
-import uuid
 from random import randint
 from faker import Faker
 
@@ -32,7 +31,6 @@ class Command(BaseCommand):
 
         for _ in range(num_listings):
             # creating random sample data
-            listing_id=str(uuid.uuid4())
             name = f"{fake.first_name().capitalize()}'s {fake.random_element(elements=["Villa", "Cottage", "Retreat", "Haven", "Lodge"])}"
             description = fake.text(max_nb_chars=200)
             location = fake.city()
@@ -40,7 +38,6 @@ class Command(BaseCommand):
 
             # create the listing instance and save in the database
             listing = Listing.objects.create(
-                listing_id=listing_id,
                 name=name,
                 description=description,
                 location=location,
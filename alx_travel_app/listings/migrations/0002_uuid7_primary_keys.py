@@ -0,0 +1,40 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:34
+
+import django.db.models.deletion
+import listings.utils.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='booking_id',
+            field=models.UUIDField(default=listings.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='listing',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='listings.listing'),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='listing_id',
+            field=models.UUIDField(default=listings.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='listing',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='listings.listing'),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='review_id',
+            field=models.UUIDField(default=listings.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:35
+
+import listings.fields
+import listings.utils.uuid7
+from django.db import migrations, models
+from django.db.migrations.exceptions import IrreversibleError
+
+
+# (model, column, nullable) for every UUID column stored as char(32) hex on MySQL.
+UUID_COLUMNS = [
+    ('Listing', 'listing_id', False),
+    ('Booking', 'booking_id', False),
+    ('Booking', 'listing_id', True),
+    ('Review', 'review_id', False),
+    ('Review', 'listing_id', True),
+]
+
+
+def unhex_uuid_columns(apps, schema_editor):
+    """
+    Converts the char(32) hex UUIDs to raw bytes before the binary(16) AlterFields.
+
+    MySQL cannot cast 32 hex characters into binary(16), so each column is first
+    widened to varbinary(32) and rewritten with UNHEX(). The foreign keys on
+    listing_id are dropped so their columns can change type; the AlterField on
+    Listing.listing_id recreates them once the referenced column is binary(16).
+    Other backends store UUIDs natively or keep their column type, so this is a
+    no-op there.
+    """
+    if schema_editor.connection.vendor != 'mysql':
+        return
+
+    for model_name in ('Booking', 'Review'):
+        model = apps.get_model('listings', model_name)
+        for fk_name in schema_editor._constraint_names(model, ['listing_id'], foreign_key=True):
+            schema_editor.execute(schema_editor._delete_fk_sql(model, fk_name))
+
+    for model_name, column, nullable in UUID_COLUMNS:
+        table = schema_editor.quote_name(apps.get_model('listings', model_name)._meta.db_table)
+        column = schema_editor.quote_name(column)
+        null = 'NULL' if nullable else 'NOT NULL'
+        schema_editor.execute(f"ALTER TABLE {table} MODIFY {column} varbinary(32) {null}")
+        schema_editor.execute(f"UPDATE {table} SET {column} = UNHEX({column}) WHERE {column} IS NOT NULL")
+
+
+def refuse_mysql_rollback(apps, schema_editor):
+    """
+    Stops a rollback on MySQL before the AlterFields are reversed, since raw
+    binary(16) bytes cannot be cast back into char(32) hex.
+    """
+    if schema_editor.connection.vendor == 'mysql':
+        raise IrreversibleError("binary(16) UUID keys cannot be converted back to char(32) automatically.")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0002_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(unhex_uuid_columns, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='booking',
+            name='booking_id',
+            field=listings.fields.BinaryUUIDField(default=listings.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='end_date',
+            field=models.DateField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='start_date',
+            field=models.DateField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='listing_id',
+            field=listings.fields.BinaryUUIDField(default=listings.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='review_id',
+            field=listings.fields.BinaryUUIDField(default=listings.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, refuse_mysql_rollback),
+    ]
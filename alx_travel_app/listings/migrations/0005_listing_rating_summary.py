@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:35
+
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def backfill_rating_summary(apps, schema_editor):
+    Listing = apps.get_model('listings', 'Listing')
+    Review = apps.get_model('listings', 'Review')
+    summaries = (
+        Review.objects.filter(listing__isnull=False)
+        .order_by()
+        .values('listing')
+        .annotate(avg=Avg('rating'), count=Count('pk'))
+    )
+    for summary in summaries:
+        Listing.objects.filter(pk=summary['listing']).update(
+            avg_rating=round(summary['avg'], 2),
+            review_count=summary['count'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0004_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='avg_rating',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=3),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_rating_summary, migrations.RunPython.noop),
+    ]
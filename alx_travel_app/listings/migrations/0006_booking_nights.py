@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+
+def backfill_nights(apps, schema_editor):
+    Booking = apps.get_model('listings', 'Booking')
+    bookings = list(Booking.objects.only('booking_id', 'start_date', 'end_date'))
+    for booking in bookings:
+        booking.nights = max((booking.end_date - booking.start_date).days, 0)
+    Booking.objects.bulk_update(bookings, ['nights'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0005_listing_rating_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='nights',
+            field=models.PositiveSmallIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_nights, migrations.RunPython.noop),
+    ]
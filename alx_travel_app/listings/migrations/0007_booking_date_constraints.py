@@ -0,0 +1,42 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:39
+
+from django.db import migrations, models
+from django.db.models import F, Q
+
+
+def check_existing_bookings(apps, schema_editor):
+    """
+    Refuses to add the constraints while bookings violate them.
+
+    Rows with start_date >= end_date predate serializer validation being the
+    only guard; 0006 backfilled them with nights=0. Their dates cannot be
+    repaired automatically, so they have to be fixed or deleted by hand before
+    this migration can run.
+    """
+    Booking = apps.get_model('listings', 'Booking')
+    invalid = Booking.objects.filter(Q(start_date__gte=F('end_date')) | Q(nights__lte=0))
+    invalid_ids = [str(booking_id) for booking_id in invalid.values_list('booking_id', flat=True)[:20]]
+    if invalid_ids:
+        raise RuntimeError(
+            f"{invalid.count()} booking(s) have start_date >= end_date or nights <= 0 and must be "
+            f"corrected or deleted before adding the date constraints: {', '.join(invalid_ids)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0006_booking_nights'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_existing_bookings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.CheckConstraint(condition=models.Q(('start_date__lt', models.F('end_date'))), name='booking_start_before_end'),
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.CheckConstraint(condition=models.Q(('nights__gt', 0)), name='booking_positive_nights'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0008_review_rating_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='listing',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='listings.listing'),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='listing',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='listings.listing'),
+        ),
+    ]
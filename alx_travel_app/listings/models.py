@@ -1,5 +1,7 @@
 from django.db import models
-import uuid
+from django.db.models import F, Q
+from listings.fields import BinaryUUIDField
+from listings.utils.uuid7 import uuid7
 
 
 STATUS = (
@@ -8,6 +10,9 @@ STATUS = (
     ('cancelled', 'Cancelled'),
 )
 
+# Largest value a PositiveSmallIntegerField holds on every supported backend.
+MAX_BOOKING_NIGHTS = 32767
+
 RATING = (
     ( 1, '★☆☆☆☆'),
     ( 2, '★★☆☆☆'),
@@ -22,16 +27,20 @@ class Listing(models.Model):
     Represents a property listing available for booking.
 
     Fields:
-        - listing_id (UUIDField): The unique identifier for the listing, auto-generated as a UUID.
+        - listing_id (BinaryUUIDField): The unique identifier for the listing, auto-generated as a time-ordered UUIDv7.
         - name (CharField): The name of the property (e.g., "Cozy Apartment"), max_length=50.
         - description (TextField): A detailed description of the property.
         - location (CharField): The address or general location of the property, max_length=50.
         - price_per_night (DecimalField): The nightly rental price, allowing up to 7 digits with 2 decimal places.
+        - avg_rating (DecimalField): The average review rating, kept in sync by the `Review` signals (not editable).
+        - review_count (PositiveIntegerField): The number of reviews, kept in sync by the `Review` signals (not editable).
         - created_at (DateTimeField): The timestamp when the listing was created (automatically set).
-        - updated_at (DateTimeField): The timestamp when the listing was last updated (automatically updated).
+        - updated_at (DateTimeField): The timestamp when the listing was last updated (automatically updated on save();
+          `QuerySet.update()` calls must set it explicitly, as it keys the `ListingSerializer` cache).
 
     Meta:
         - ordering: Orders listings by the `created_at` field in descending order.
+        - indexes: Descending index on `created_at` backing the default ordering.
         - verbose_name: Human-readable name for the model ("Listing").
         - verbose_name_plural: Human-readable plural name for the model ("Listings").
 
@@ -39,16 +48,21 @@ class Listing(models.Model):
         - __str__: Returns the name of the listing for easy representation in Django admin and other contexts.
     """
 
-    listing_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    listing_id = BinaryUUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=50, null=False, blank=False)
     description = models.TextField(blank=False)
     location = models.CharField(max_length=50, null=False, blank=False)
     price_per_night = models.DecimalField(max_digits=7, decimal_places=2)
+    avg_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0, editable=False)
+    review_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='listing_created_desc_idx'),
+        ]
         verbose_name = "Listing"
         verbose_name_plural = "Listings"
 
@@ -63,16 +77,20 @@ class Booking(models.Model):
     Represents a reservation made for a specific listing.
 
     Fields:
-        - booking_id (UUIDField): The unique identifier for the booking, auto-generated as a UUID.
+        - booking_id (BinaryUUIDField): The unique identifier for the booking, auto-generated as a time-ordered UUIDv7.
         - listing (ForeignKey): References the associated `Listing` (nullable; cascades as SET_NULL on deletion).
-        - start_date (DateField): The date when the booking starts.
-        - end_date (DateField): The date when the booking ends.
-        - total_price (DecimalField): The total cost of the booking, allowing up to 10 digits with 2 decimal places.
+          Not indexed on its own; the composite (`listing`, `-created_at`) index covers it.
+        - start_date (DateField): The date when the booking starts (indexed for date-range filtering).
+        - end_date (DateField): The date when the booking ends (indexed for date-range filtering).
+        - nights (PositiveSmallIntegerField): The number of nights booked (`end_date - start_date`).
+        - total_price (DecimalField): The total cost of the booking (`nights * price_per_night`), allowing up to 10 digits with 2 decimal places.
         - status (CharField): The current status of the booking, with choices like "Pending", "Confirmed", and "Cancelled".
         - created_at (DateTimeField): The timestamp when the booking was created (automatically set).
 
     Meta:
         - ordering: Orders bookings by the `created_at` field in descending order.
+        - indexes: Composite index on (`listing`, `-created_at`) for listing-scoped bookings in default order.
+        - constraints: Database CHECKs that `start_date` is before `end_date` and that `nights` is positive.
         - verbose_name: Human-readable name for the model ("Booking").
         - verbose_name_plural: Human-readable plural name for the model ("Bookings").
 
@@ -80,16 +98,24 @@ class Booking(models.Model):
         - __str__: Returns a string representation of the booking, including its ID and associated listing.
     """
     
-    booking_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    listing = models.ForeignKey(Listing, on_delete=models.CASCADE, null=True, related_name="bookings")
-    start_date = models.DateField()
-    end_date = models.DateField()
+    booking_id = BinaryUUIDField(primary_key=True, default=uuid7, editable=False)
+    listing = models.ForeignKey(Listing, on_delete=models.CASCADE, null=True, related_name="bookings", db_index=False)
+    start_date = models.DateField(db_index=True)
+    end_date = models.DateField(db_index=True)
+    nights = models.PositiveSmallIntegerField()
     total_price = models.DecimalField(max_digits=10, decimal_places=2)
     status = models.CharField(choices=STATUS, max_length=10, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['listing', '-created_at'], name='booking_listing_created_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=Q(start_date__lt=F('end_date')), name='booking_start_before_end'),
+            models.CheckConstraint(condition=Q(nights__gt=0), name='booking_positive_nights'),
+        ]
         verbose_name = "Booking"
         verbose_name_plural = "Bookings"
 
@@ -103,14 +129,17 @@ class Review(models.Model):
     Represents a customer review for a specific listing.
 
     Fields:
-        - review_id (UUIDField): The unique identifier for the review, auto-generated as a UUID.
+        - review_id (BinaryUUIDField): The unique identifier for the review, auto-generated as a time-ordered UUIDv7.
         - listing (ForeignKey): References the associated `Listing` (nullable; cascades as SET_NULL on deletion).
-        - rating (IntegerField): The rating provided by the customer, with choices from 1 to 5 stars.
+          Not indexed on its own; the composite (`listing`, `-created_at`) index covers it.
+        - rating (PositiveSmallIntegerField): The rating provided by the customer, with choices from 1 to 5 stars.
         - comment (TextField): The textual feedback provided by the customer.
         - created_at (DateTimeField): The timestamp when the review was created (automatically set).
 
     Meta:
         - ordering: Orders reviews by the `created_at` field in descending order.
+        - indexes: Composite index on (`listing`, `-created_at`) for listing-scoped reviews in default order.
+        - constraints: Database CHECK that `rating` is between 1 and 5.
         - verbose_name: Human-readable name for the model ("Review").
         - verbose_name_plural: Human-readable plural name for the model ("Reviews").
 
@@ -118,14 +147,20 @@ class Review(models.Model):
         - __str__: Returns a string representation of the review, including its ID and rating.
     """
 
-    review_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    listing = models.ForeignKey(Listing, on_delete=models.CASCADE, null=True, related_name="reviews")
-    rating = models.IntegerField(choices=RATING)
+    review_id = BinaryUUIDField(primary_key=True, default=uuid7, editable=False)
+    listing = models.ForeignKey(Listing, on_delete=models.CASCADE, null=True, related_name="reviews", db_index=False)
+    rating = models.PositiveSmallIntegerField(choices=RATING)
     comment = models.TextField(blank=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['listing', '-created_at'], name='review_listing_created_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=Q(rating__gte=1) & Q(rating__lte=5), name='review_rating_1_5'),
+        ]
         verbose_name = "Review"
         verbose_name_plural = "Reviews"
 
@@ -0,0 +1,33 @@
+from listings.models import Booking, MAX_BOOKING_NIGHTS
+
+
+# Largest total price, in cents, that fits the Booking.total_price column.
+MAX_TOTAL_CENTS = 10 ** Booking._meta.get_field('total_price').max_digits - 1
+
+
+def compute_totals(starts, ends, price_cents):
+    """
+    Computes nights and total prices for a batch of bookings.
+
+    Works on plain integers (date ordinals and prices in cents) so bulk
+    imports avoid per-row date and Decimal arithmetic. The API path keeps
+    using `BookingSerializer.validate`.
+
+    Args:
+        starts (Sequence[int]): Start dates as ordinals (`date.toordinal()`).
+        ends (Sequence[int]): End dates as ordinals.
+        price_cents (Sequence[int]): Nightly price of each booking's listing, in cents.
+
+    Returns:
+        tuple[list[int], list[int], list[bool]]: The nights, total prices in
+        cents, and a mask that is False where the start date is not before
+        the end date, the stay is longer than MAX_BOOKING_NIGHTS, or the total
+        does not fit the total_price column.
+    """
+    nights = [end - start for start, end in zip(starts, ends)]
+    totals = [n * price for n, price in zip(nights, price_cents)]
+    valid = [
+        0 < n <= MAX_BOOKING_NIGHTS and total <= MAX_TOTAL_CENTS
+        for n, total in zip(nights, totals)
+    ]
+    return nights, totals, valid
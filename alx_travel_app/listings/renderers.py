@@ -0,0 +1,39 @@
+from decimal import Decimal
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+import orjson
+
+
+def _default(obj):
+    """
+    Serializes the types orjson does not handle natively.
+
+    Decimals keep their exact string form (e.g. "120.00"), matching DRF's
+    COERCE_DECIMAL_TO_STRING behaviour; lazy translation strings are forced.
+    """
+    if isinstance(obj, (Decimal, Promise)):
+        return str(obj)
+    raise TypeError
+
+
+class OrjsonRenderer(BaseRenderer):
+    """
+    Renders API responses as JSON using orjson.
+
+    orjson serializes UUIDs, datetimes and dict/list subclasses (such as the
+    ReturnDict/ReturnList DRF serializers produce) in C, which avoids the
+    Python-level fallbacks the stdlib `json` module uses for these types.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        )
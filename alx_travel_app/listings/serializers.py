@@ -1,5 +1,11 @@
+from django.core.cache import cache
 from rest_framework import serializers
-from listings.models import Listing, Booking
+from listings.models import Listing, Booking, MAX_BOOKING_NIGHTS
+from decimal import Decimal
+
+
+# How long a cached listing representation is kept, in seconds.
+LISTING_CACHE_TIMEOUT = 60 * 60
 
 
 class ListingSerializer(serializers.ModelSerializer):
@@ -14,8 +20,12 @@ class ListingSerializer(serializers.ModelSerializer):
         - description: Text field for detailed property description.
         - location: Location/address of the property, max_length=50.
         - price_per_night: Decimal value representing nightly rate.
+        - avg_rating: Decimal average of the listing's review ratings (read-only).
+        - review_count: Number of reviews for the listing (read-only).
         - created_at: Timestamp when the listing was created (read-only).
         - updated_at: Timestamp when the listing was last updated (read-only).
+
+    Representations are cached per listing version (see `to_representation`).
     """
     class Meta:
         model = Listing
@@ -25,10 +35,40 @@ class ListingSerializer(serializers.ModelSerializer):
             'description',
             'location',
             'price_per_night',
+            'avg_rating',
+            'review_count',
             'created_at',
             'updated_at',
         ]
-        read_only_fields = ['listing_id','created_at', 'updated_at']
+        read_only_fields = ['listing_id', 'avg_rating', 'review_count', 'created_at', 'updated_at']
+
+    def to_representation(self, instance):
+        """
+        Returns the cached representation of the listing when available.
+
+        The cache key includes `updated_at`, which `save()` bumps, so an edit
+        made through the model makes the old entry unreachable and it expires
+        on its own. `QuerySet.update()` does not apply `auto_now`: bulk writes
+        to listing fields must also set `updated_at=Now()`, or the old payload
+        is served for up to LISTING_CACHE_TIMEOUT. The review summary fields
+        are part of the key for this reason, because the review signals update
+        them without touching `updated_at`.
+
+        Anything other than a saved Listing (e.g. `validated_data` when `.data`
+        is read before `save()`) is serialized without the cache.
+        """
+        if not isinstance(instance, Listing):
+            return super().to_representation(instance)
+
+        key = (
+            f"ls:{instance.listing_id}:{instance.updated_at.timestamp()}"
+            f":{instance.review_count}:{instance.avg_rating}"
+        )
+        data = cache.get(key)
+        if data is None:
+            data = super().to_representation(instance)
+            cache.set(key, data, LISTING_CACHE_TIMEOUT)
+        return data
 
 
 
@@ -43,12 +83,15 @@ class BookingSerializer(serializers.ModelSerializer):
         - listing: ForeignKey referencing the associated Listing (PrimaryKeyRelatedField).
         - start_date: Date when the booking begins.
         - end_date: Date when the booking ends.
-        - total_price: Decimal value representing the total booking cost.
+        - nights: Number of nights booked, derived from the dates (read-only).
+        - total_price: Decimal value representing the total booking cost, derived from
+          nights and the listing's price_per_night (read-only).
         - status: String field representing the booking status, with choices such as 'Pending', 'Confirmed', 'Cancelled'.
         - created_at: Timestamp when the booking was created (read-only).
 
     Validation:
         - Ensures the start_date is earlier than the end_date, raising a ValidationError otherwise.
+        - Computes nights and total_price server-side rather than trusting client input.
     """
 
     listing = serializers.PrimaryKeyRelatedField(queryset=Listing.objects.all())
@@ -60,22 +103,38 @@ class BookingSerializer(serializers.ModelSerializer):
             'listing',
             'start_date',
             'end_date',
+            'nights',
             'total_price',
             'status',
             'created_at',
         ]
-        read_only_fields = ['booking_id','created_at']
+        read_only_fields = ['booking_id', 'nights', 'total_price', 'created_at']
 
     def validate(self, data):
         """
         Custom validation method.
 
-        Ensures that the start_date is earlier than the end_date.
+        Ensures that the start_date is earlier than the end_date, then sets
+        nights and total_price from the dates and the listing's price_per_night.
+        On partial updates, missing values fall back to the existing instance.
         Raises:
-            serializers.ValidationError: If start_date is not before end_date.
+            serializers.ValidationError: If start_date is not before end_date, if the
+            stay is longer than MAX_BOOKING_NIGHTS, or if the total price does not
+            fit the total_price column.
         """
-        start_date = data.get('start_date')
-        end_date = data.get('end_date')
+        start_date = data.get('start_date', getattr(self.instance, 'start_date', None))
+        end_date = data.get('end_date', getattr(self.instance, 'end_date', None))
+        listing = data.get('listing', getattr(self.instance, 'listing', None))
         if start_date and end_date and start_date >= end_date:
             raise serializers.ValidationError("Start date must be before end date.")
+        if start_date and end_date and listing:
+            nights = (end_date - start_date).days
+            if nights > MAX_BOOKING_NIGHTS:
+                raise serializers.ValidationError(f"A booking cannot exceed {MAX_BOOKING_NIGHTS} nights.")
+            total_price = nights * listing.price_per_night
+            total_field = Booking._meta.get_field('total_price')
+            if total_price >= Decimal(10) ** (total_field.max_digits - total_field.decimal_places):
+                raise serializers.ValidationError("Total price exceeds the maximum allowed value.")
+            data['nights'] = nights
+            data['total_price'] = total_price
         return data
\ No newline at end of file
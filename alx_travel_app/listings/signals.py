@@ -0,0 +1,78 @@
+from django.db.models import DEFERRED, Avg, Count, DecimalField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+from listings.models import Listing, Review
+
+
+def update_listing_rating(listing_id):
+    """
+    Recomputes the denormalized `avg_rating` and `review_count` of a listing.
+
+    Runs as a single UPDATE with correlated subqueries over the listing's
+    reviews, so list views can read both values straight from the listing row
+    instead of aggregating reviews per listing.
+    """
+    if listing_id is None:
+        return
+
+    reviews = Review.objects.filter(listing=OuterRef('pk')).order_by().values('listing')
+    Listing.objects.filter(pk=listing_id).update(
+        avg_rating=Coalesce(
+            Subquery(reviews.annotate(
+                avg=Cast(Avg('rating'), DecimalField(max_digits=3, decimal_places=2))
+            ).values('avg')),
+            Value(0),
+            output_field=DecimalField(max_digits=3, decimal_places=2),
+        ),
+        review_count=Coalesce(
+            Subquery(reviews.annotate(count=Count('pk')).values('count')),
+            Value(0),
+        ),
+    )
+
+
+@receiver(post_init, sender=Review)
+def review_loaded(sender, instance, **kwargs):
+    """
+    Remembers the listing a review belongs to when it is loaded, so a later
+    save can tell whether it was moved to another listing.
+
+    Reads from `__dict__` to avoid loading a deferred `listing` field; a
+    deferred value is resolved in `review_saving` instead.
+    """
+    instance._original_listing_id = instance.__dict__.get('listing_id', DEFERRED)
+
+
+@receiver(pre_save, sender=Review)
+def review_saving(sender, instance, **kwargs):
+    """
+    Looks up the stored listing of a review loaded with `listing` deferred.
+    """
+    if instance._original_listing_id is DEFERRED:
+        instance._original_listing_id = (
+            Review.objects.filter(pk=instance.pk).values_list('listing_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, **kwargs):
+    """
+    Refreshes the listing rating whenever a review is created or updated.
+
+    If the review was moved to another listing, the listing it left is
+    refreshed as well.
+    """
+    original_listing_id = instance._original_listing_id
+    update_listing_rating(instance.listing_id)
+    if original_listing_id != instance.listing_id:
+        update_listing_rating(original_listing_id)
+    instance._original_listing_id = instance.listing_id
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, **kwargs):
+    """
+    Refreshes the listing rating whenever a review is deleted.
+    """
+    update_listing_rating(instance.listing_id)
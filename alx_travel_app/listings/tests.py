@@ -1,3 +1,559 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models.functions import Now
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from listings.models import Listing, Booking, Review, MAX_BOOKING_NIGHTS
+from listings.pricing import MAX_TOTAL_CENTS, compute_totals
+from listings.renderers import OrjsonRenderer
+from listings.serializers import BookingSerializer, ListingSerializer
+from listings.utils.uuid7 import uuid7
+from datetime import date, datetime, timedelta, timezone
+from django.utils.translation import gettext_lazy
+from io import StringIO
+import json
+import os
+import tempfile
+from decimal import Decimal
+import time
+import uuid
 
-# Create your tests here.
+
+def create_listing(**kwargs):
+    fields = {
+        'name': "Cozy Apartment",
+        'description': "Near the beach.",
+        'location': "Lagos",
+        'price_per_night': Decimal('100.00'),
+    }
+    fields.update(kwargs)
+    return Listing.objects.create(**fields)
+
+
+class UUID7Tests(TestCase):
+    """
+    Tests for the time-ordered UUIDv7 generator.
+    """
+
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_timestamp_prefix(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        self.assertTrue(before <= value.int >> 80 <= after)
+
+    def test_later_values_sort_after_earlier_ones(self):
+        first = uuid7()
+        time.sleep(0.002)
+        self.assertLess(first, uuid7())
+
+    def test_unique(self):
+        self.assertEqual(len({uuid7() for _ in range(1000)}), 1000)
+
+    def test_model_default(self):
+        self.assertEqual(create_listing().pk.version, 7)
+
+
+class FakeMySQLConnection:
+    vendor = 'mysql'
+
+
+class BinaryUUIDFieldTests(TestCase):
+    """
+    Tests for the binary(16) UUID storage used on MySQL.
+    """
+
+    def setUp(self):
+        self.field = Listing._meta.pk
+        self.connection = FakeMySQLConnection()
+
+    def test_mysql_column_is_binary(self):
+        self.assertEqual(self.field.db_type(self.connection), 'binary(16)')
+        self.assertEqual(Listing.bookings.field.db_type(self.connection), 'binary(16)')
+
+    def test_mysql_round_trip(self):
+        value = uuid.uuid4()
+        raw = self.field.get_db_prep_value(str(value), self.connection)
+        self.assertEqual(raw, value.bytes)
+        self.assertEqual(self.field.from_db_value(raw, None, self.connection), value)
+
+    def test_other_backends_keep_default_storage(self):
+        listing = create_listing()
+        self.assertEqual(Listing.objects.get(pk=str(listing.pk)).pk, listing.pk)
+
+
+class ListingRatingSignalTests(TestCase):
+    """
+    Tests that the denormalized Listing.avg_rating and Listing.review_count
+    follow review creates, updates, moves and deletes.
+    """
+
+    def setUp(self):
+        self.listing = create_listing()
+        self.other_listing = create_listing(name="Quiet Cottage")
+
+    def assertRating(self, listing, avg_rating, review_count):
+        listing.refresh_from_db()
+        self.assertEqual(listing.avg_rating, Decimal(avg_rating))
+        self.assertEqual(listing.review_count, review_count)
+
+    def test_create_review(self):
+        Review.objects.create(listing=self.listing, rating=5, comment="Great")
+        Review.objects.create(listing=self.listing, rating=4, comment="Good")
+        self.assertRating(self.listing, '4.50', 2)
+
+    def test_update_review(self):
+        review = Review.objects.create(listing=self.listing, rating=5, comment="Great")
+        review.rating = 2
+        review.save()
+        self.assertRating(self.listing, '2.00', 1)
+
+    def test_delete_review(self):
+        review = Review.objects.create(listing=self.listing, rating=5, comment="Great")
+        Review.objects.create(listing=self.listing, rating=3, comment="Okay")
+        review.delete()
+        self.assertRating(self.listing, '3.00', 1)
+
+    def test_delete_last_review_resets_summary(self):
+        Review.objects.create(listing=self.listing, rating=5, comment="Great").delete()
+        self.assertRating(self.listing, '0.00', 0)
+
+    def test_move_review_to_another_listing(self):
+        for rating in (5, 4, 4):
+            Review.objects.create(listing=self.listing, rating=rating, comment="Nice")
+        review = Review.objects.get(listing=self.listing, rating=5)
+        review.listing = self.other_listing
+        review.save()
+        self.assertRating(self.listing, '4.00', 2)
+        self.assertRating(self.other_listing, '5.00', 1)
+
+    def test_move_review_loaded_with_deferred_listing(self):
+        Review.objects.create(listing=self.listing, rating=5, comment="Great")
+        Review.objects.create(listing=self.listing, rating=3, comment="Okay")
+        review = Review.objects.only('review_id', 'rating').get(rating=5)
+        review.listing = self.other_listing
+        review.save()
+        self.assertRating(self.listing, '3.00', 1)
+        self.assertRating(self.other_listing, '5.00', 1)
+
+
+class RatingSummaryBackfillTests(TransactionTestCase):
+    """
+    Tests that migration 0005 backfills the rating summary of existing listings.
+    """
+
+    migrate_from = [('listings', '0004_created_at_indexes')]
+    migrate_to = [('listings', '0005_listing_rating_summary')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_backfill(self):
+        apps = self.migrate(self.migrate_from)
+        OldListing = apps.get_model('listings', 'Listing')
+        OldReview = apps.get_model('listings', 'Review')
+        reviewed = OldListing.objects.create(
+            name="Cozy Apartment", description="Near the beach.", location="Lagos", price_per_night=100
+        )
+        unreviewed = OldListing.objects.create(
+            name="Quiet Cottage", description="In the hills.", location="Jos", price_per_night=80
+        )
+        for rating in (5, 4, 4):
+            OldReview.objects.create(listing=reviewed, rating=rating, comment="Nice")
+
+        apps = self.migrate(self.migrate_to)
+        NewListing = apps.get_model('listings', 'Listing')
+        reviewed = NewListing.objects.get(pk=reviewed.pk)
+        unreviewed = NewListing.objects.get(pk=unreviewed.pk)
+        self.assertEqual(reviewed.avg_rating, Decimal('4.33'))
+        self.assertEqual(reviewed.review_count, 3)
+        self.assertEqual(unreviewed.avg_rating, Decimal('0.00'))
+        self.assertEqual(unreviewed.review_count, 0)
+
+
+class BookingSerializerTests(TestCase):
+    """
+    Tests that BookingSerializer derives nights and total_price server-side
+    and rejects values the columns cannot store.
+    """
+
+    def setUp(self):
+        self.listing = create_listing(price_per_night=Decimal('120.50'))
+
+    def serializer(self, start_date, end_date, listing=None, **kwargs):
+        data = {
+            'listing': str((listing or self.listing).pk),
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+        }
+        data.update(kwargs)
+        return BookingSerializer(data=data)
+
+    def test_derives_nights_and_total_price(self):
+        serializer = self.serializer(date(2025, 1, 1), date(2025, 1, 4), total_price='1.00')
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        booking = serializer.save()
+        self.assertEqual(booking.nights, 3)
+        self.assertEqual(booking.total_price, Decimal('361.50'))
+
+    def test_partial_update_recomputes_from_instance(self):
+        serializer = self.serializer(date(2025, 1, 1), date(2025, 1, 4))
+        serializer.is_valid(raise_exception=True)
+        booking = serializer.save()
+        serializer = BookingSerializer(booking, data={'end_date': '2025-01-02'}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        booking = serializer.save()
+        self.assertEqual(booking.nights, 1)
+        self.assertEqual(booking.total_price, Decimal('120.50'))
+
+    def test_rejects_end_before_start(self):
+        self.assertFalse(self.serializer(date(2025, 1, 4), date(2025, 1, 1)).is_valid())
+
+    def test_rejects_too_many_nights(self):
+        start = date(2025, 1, 1)
+        serializer = self.serializer(start, start + timedelta(days=MAX_BOOKING_NIGHTS + 1))
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('non_field_errors', serializer.errors)
+
+    def test_rejects_total_price_overflow(self):
+        listing = create_listing(price_per_night=Decimal('99999.99'))
+        start = date(2025, 1, 1)
+        serializer = self.serializer(start, start + timedelta(days=7308), listing=listing)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('non_field_errors', serializer.errors)
+        self.assertEqual(Booking.objects.count(), 0)
+
+    def test_accepts_largest_total_price(self):
+        listing = create_listing(price_per_night=Decimal('99999.99'))
+        start = date(2025, 1, 1)
+        serializer = self.serializer(start, start + timedelta(days=1000), listing=listing)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.save().total_price, Decimal('99999990.00'))
+
+
+class ListingViewSetTests(TestCase):
+    """
+    Tests for the listings API endpoint.
+    """
+
+    def test_list_runs_a_single_query(self):
+        for i in range(5):
+            listing = create_listing(name=f"Listing {i}")
+            Review.objects.create(listing=listing, rating=4, comment="Good")
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('listing-list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 5)
+        self.assertEqual(response.json()[0]['review_count'], 1)
+
+
+    def test_anonymous_writes_are_rejected(self):
+        listing = create_listing()
+        detail_url = reverse('listing-detail', args=[listing.pk])
+        payload = {
+            'name': "Quiet Cottage",
+            'description': "In the hills.",
+            'location': "Jos",
+            'price_per_night': '80.00',
+        }
+        self.assertEqual(self.client.post(reverse('listing-list'), payload, content_type='application/json').status_code, 403)
+        self.assertEqual(self.client.patch(detail_url, {'name': "Renamed"}, content_type='application/json').status_code, 403)
+        self.assertEqual(self.client.delete(detail_url).status_code, 403)
+        self.assertEqual(Listing.objects.count(), 1)
+
+    def test_authenticated_users_can_write(self):
+        self.client.force_login(get_user_model().objects.create_user('host', password='secret'))
+        response = self.client.post(reverse('listing-list'), {
+            'name': "Quiet Cottage",
+            'description': "In the hills.",
+            'location': "Jos",
+            'price_per_night': '80.00',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+
+
+class OrjsonRendererTests(TestCase):
+    """
+    Tests for the orjson-based default API renderer.
+    """
+
+    def setUp(self):
+        self.renderer = OrjsonRenderer()
+
+    def test_renders_uuid_decimal_datetime_and_lazy_strings(self):
+        value = uuid.uuid4()
+        rendered = self.renderer.render({
+            'id': value,
+            'price': Decimal('120.50'),
+            'aware': datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc),
+            'naive': datetime(2025, 1, 1, 12, 0),
+            'message': gettext_lazy("This field is required."),
+        })
+        self.assertEqual(json.loads(rendered), {
+            'id': str(value),
+            'price': '120.50',
+            'aware': '2025-01-01T12:00:00+00:00',
+            'naive': '2025-01-01T12:00:00+00:00',
+            'message': "This field is required.",
+        })
+
+    def test_renders_none_as_empty_body(self):
+        self.assertEqual(self.renderer.render(None), b'')
+
+    def test_rejects_unsupported_types(self):
+        with self.assertRaises(TypeError):
+            self.renderer.render({'value': object()})
+
+    def test_is_the_default_renderer(self):
+        listing = create_listing()
+        response = self.client.get(reverse('listing-detail', args=[listing.pk]))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()['price_per_night'], '100.00')
+
+
+class ListingSerializerCacheTests(TestCase):
+    """
+    Tests that ListingSerializer output is cached per listing version.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.listing = create_listing()
+
+    def test_repeat_reads_are_served_from_cache(self):
+        ListingSerializer(self.listing).data
+        # an unsaved change keeps updated_at, so the cached payload is returned
+        self.listing.name = "Renamed"
+        self.assertEqual(ListingSerializer(self.listing).data['name'], "Cozy Apartment")
+
+    def test_saving_the_listing_invalidates(self):
+        ListingSerializer(self.listing).data
+        self.listing.name = "Renamed"
+        self.listing.save()
+        self.assertEqual(ListingSerializer(self.listing).data['name'], "Renamed")
+
+    def test_bulk_update_setting_updated_at_invalidates(self):
+        ListingSerializer(self.listing).data
+        Listing.objects.filter(pk=self.listing.pk).update(price_per_night=Decimal('20.00'), updated_at=Now())
+        self.listing.refresh_from_db()
+        self.assertEqual(ListingSerializer(self.listing).data['price_per_night'], '20.00')
+
+    def test_unsaved_data_is_not_cached(self):
+        serializer = ListingSerializer(data={
+            'name': "Quiet Cottage",
+            'description': "In the hills.",
+            'location': "Jos",
+            'price_per_night': '80.00',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.data['name'], "Quiet Cottage")
+        self.assertEqual(serializer.data['price_per_night'], '80.00')
+
+    def test_review_changes_invalidate(self):
+        ListingSerializer(self.listing).data
+        Review.objects.create(listing=self.listing, rating=5, comment="Great")
+        self.listing.refresh_from_db()
+        data = ListingSerializer(self.listing).data
+        self.assertEqual(data['review_count'], 1)
+        self.assertEqual(data['avg_rating'], '5.00')
+
+
+class ComputeTotalsTests(TestCase):
+    """
+    Tests for the integer-cents pricing kernel used by bulk imports.
+    """
+
+    def test_computes_nights_and_totals(self):
+        start = date(2025, 1, 1).toordinal()
+        nights, totals, valid = compute_totals([start, start], [start + 3, start + 1], [12050, 9999])
+        self.assertEqual(nights, [3, 1])
+        self.assertEqual(totals, [36150, 9999])
+        self.assertEqual(valid, [True, True])
+
+    def test_masks_rows_the_booking_columns_cannot_store(self):
+        start = date(2025, 1, 1).toordinal()
+        _, _, valid = compute_totals(
+            [start, start, start, start],
+            [start, start - 1, start + MAX_BOOKING_NIGHTS + 1, start + 2],
+            [100, 100, 100, MAX_TOTAL_CENTS],
+        )
+        self.assertEqual(valid, [False, False, False, False])
+
+
+class ImportBookingsCommandTests(TestCase):
+    """
+    Tests for the import_bookings management command.
+    """
+
+    def setUp(self):
+        self.listing = create_listing(price_per_night=Decimal('99.99'))
+
+    def import_csv(self, content):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as csv_file:
+            csv_file.write(content)
+        self.addCleanup(os.remove, csv_file.name)
+        out = StringIO()
+        call_command('import_bookings', csv_file.name, stdout=out)
+        return out.getvalue()
+
+    def test_imports_valid_rows(self):
+        out = self.import_csv(
+            "listing_id,start_date,end_date,status\n"
+            f"{self.listing.pk},2025-01-01,2025-01-04,confirmed\n"
+            f"{self.listing.pk},2025-02-01,2025-02-02,\n"
+        )
+        self.assertIn("Successfully imported 2 bookings (0 skipped)", out)
+        self.assertEqual(
+            sorted(Booking.objects.values_list('nights', 'total_price', 'status')),
+            [(1, Decimal('99.99'), 'pending'), (3, Decimal('299.97'), 'confirmed')],
+        )
+
+    def test_skips_invalid_rows(self):
+        start = date(2025, 1, 1)
+        out = self.import_csv(
+            "listing_id,start_date,end_date,status\n"
+            "not-a-uuid,2025-01-01,2025-01-02,\n"
+            f"{self.listing.pk},01/02/2025,2025-01-03,\n"
+            f"{self.listing.pk},2025-01-01\n"
+            f"{uuid.uuid4()},2025-01-01,2025-01-02,\n"
+            f"{self.listing.pk},2025-01-05,2025-01-04,\n"
+            f"{self.listing.pk},2025-01-01,2025-01-02,bogus_status\n"
+            f"{self.listing.pk},{start},{start + timedelta(days=MAX_BOOKING_NIGHTS + 1)},\n"
+            f"{self.listing.pk},2025-03-01,2025-03-02,cancelled\n"
+        )
+        self.assertIn("Successfully imported 1 bookings (7 skipped)", out)
+        self.assertEqual(list(Booking.objects.values_list('status', flat=True)), ['cancelled'])
+
+    def test_missing_column(self):
+        with self.assertRaises(CommandError):
+            self.import_csv("listing_id,start_date\n")
+        self.assertEqual(Booking.objects.count(), 0)
+
+
+class BookingConstraintTests(TestCase):
+    """
+    Tests that the database rejects bookings with invalid dates or nights,
+    including writes that bypass BookingSerializer.
+    """
+
+    def setUp(self):
+        self.listing = create_listing()
+
+    def booking(self, start_date, end_date, nights):
+        return Booking(
+            listing=self.listing,
+            start_date=start_date,
+            end_date=end_date,
+            nights=nights,
+            total_price=Decimal('100.00'),
+        )
+
+    def assertRejected(self, write):
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                write()
+        self.assertEqual(Booking.objects.count(), 0)
+
+    def test_start_date_equal_to_end_date(self):
+        self.assertRejected(lambda: self.booking(date(2025, 1, 1), date(2025, 1, 1), 1).save())
+
+    def test_start_date_after_end_date(self):
+        self.assertRejected(lambda: self.booking(date(2025, 1, 3), date(2025, 1, 1), 1).save())
+
+    def test_zero_nights(self):
+        self.assertRejected(lambda: self.booking(date(2025, 1, 1), date(2025, 1, 2), 0).save())
+
+    def test_bulk_create(self):
+        self.assertRejected(lambda: Booking.objects.bulk_create([
+            self.booking(date(2025, 1, 1), date(2025, 1, 2), 1),
+            self.booking(date(2025, 1, 2), date(2025, 1, 1), 1),
+        ]))
+        self.assertRejected(lambda: Booking.objects.bulk_create([
+            self.booking(date(2025, 1, 1), date(2025, 1, 2), 0),
+        ]))
+
+    def test_valid_booking(self):
+        self.booking(date(2025, 1, 1), date(2025, 1, 2), 1).save()
+        self.assertEqual(Booking.objects.count(), 1)
+
+
+class BookingConstraintMigrationTests(TransactionTestCase):
+    """
+    Tests that migration 0007 stops on legacy bookings that violate the constraints.
+    """
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_refuses_invalid_legacy_bookings(self):
+        apps = self.migrate([('listings', '0006_booking_nights')])
+        OldListing = apps.get_model('listings', 'Listing')
+        OldBooking = apps.get_model('listings', 'Booking')
+        listing = OldListing.objects.create(
+            name="Cozy Apartment", description="Near the beach.", location="Lagos", price_per_night=100
+        )
+        booking = OldBooking.objects.create(
+            listing=listing, start_date=date(2025, 1, 3), end_date=date(2025, 1, 1), nights=0, total_price=0
+        )
+        with self.assertRaisesMessage(RuntimeError, str(booking.pk)):
+            self.migrate([('listings', '0007_booking_date_constraints')])
+        booking.delete()
+
+
+class ReviewRatingConstraintTests(TestCase):
+    """
+    Tests that the database enforces the 1-5 range of Review.rating.
+    """
+
+    def setUp(self):
+        self.listing = create_listing()
+
+    def test_out_of_range_ratings_are_rejected(self):
+        for rating in (0, 6):
+            with self.subTest(rating=rating):
+                with self.assertRaises(IntegrityError):
+                    with transaction.atomic():
+                        Review.objects.create(listing=self.listing, rating=rating, comment="Odd")
+        self.assertEqual(Review.objects.count(), 0)
+
+    def test_boundary_ratings_are_accepted(self):
+        for rating in (1, 5):
+            Review.objects.create(listing=self.listing, rating=rating, comment="Fine")
+        self.assertEqual(Review.objects.count(), 2)
+
+    def test_rating_is_a_small_integer(self):
+        self.assertEqual(Review._meta.get_field('rating').get_internal_type(), 'PositiveSmallIntegerField')
+
+
+class ListingForeignKeyIndexTests(TestCase):
+    """
+    Tests that the listing foreign keys rely on the composite
+    (listing, -created_at) indexes instead of a redundant single-column index.
+    """
+
+    def test_listing_column_is_only_indexed_by_composite_index(self):
+        for model, index_name in ((Booking, 'booking_listing_created_idx'), (Review, 'review_listing_created_idx')):
+            with self.subTest(model=model.__name__), connection.cursor() as cursor:
+                constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+                indexed_columns = [c['columns'] for c in constraints.values() if c['index'] and not c['primary_key']]
+                self.assertNotIn(['listing_id'], indexed_columns)
+                self.assertEqual(constraints[index_name]['columns'][0], 'listing_id')
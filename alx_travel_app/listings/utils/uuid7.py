@@ -0,0 +1,35 @@
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """
+    Generates a time-ordered UUID following the version 7 layout
+    (draft-ietf-uuidrev-rfc4122bis).
+
+    Layout (128 bits):
+        - unix_ts_ms (48 bits): Milliseconds since the Unix epoch.
+        - ver (4 bits): The UUID version, always 7.
+        - rand_a (12 bits): Random bits.
+        - var (2 bits): The RFC 4122 variant, always 0b10.
+        - rand_b (62 bits): Random bits.
+
+    Because the timestamp occupies the most significant bits, successive values
+    sort in creation order, so new rows are appended to the right-hand side of
+    the primary key index instead of landing on random pages.
+
+    Returns:
+        uuid.UUID: A new version 7 UUID.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    rand_a = rand >> 68
+    rand_b = rand & ((1 << 62) - 1)
+
+    value = (unix_ts_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76
+    value |= rand_a << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
@@ -1,3 +1,22 @@
-from django.shortcuts import render
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from listings.models import Listing
+from listings.serializers import ListingSerializer
 
-# Create your views here.
+
+class ListingViewSet(viewsets.ModelViewSet):
+    """
+    API endpoint for listing, retrieving, creating, updating and deleting listings.
+
+    Reads are public; creating, updating and deleting require an authenticated user.
+
+    `ListingSerializer` only reads columns of the listing row itself (review
+    aggregates come from the denormalized `avg_rating` and `review_count`
+    columns), so every action is served by a single query with no related
+    lookups. A serializer field that reads `bookings` or `reviews` should be
+    paired with a matching `prefetch_related` in this queryset.
+    """
+
+    serializer_class = ListingSerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    queryset = Listing.objects.all()